@@ -1,19 +1,90 @@
 import requests
-import json
-import base64
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import asyncio
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+import binascii
+import functools
+import hashlib
+import os
+import pathlib
 import time
-from typing import Optional, List, Dict, Union, Any, Generator, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Union, Any, AsyncGenerator, Generator, Callable
+
+def _build_adapter() -> HTTPAdapter:
+    return HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(['GET', 'POST'])
+        )
+    )
+
+_bootstrap_session = requests.Session()
+_bootstrap_session.mount('https://', _build_adapter())
+
+_TOKEN_CACHE_PATH = pathlib.Path('~/.uwuzu_tokens.json').expanduser()
+_TOKEN_CACHE_TTL = 3600
+
+def _token_cache_get(key: str) -> Optional[Dict]:
+    try:
+        entries = orjson.loads(_TOKEN_CACHE_PATH.read_bytes())
+        if not isinstance(entries, dict):
+            return None
+        entry = entries.get(key)
+        if entry and time.time() - entry['cached_at'] < _TOKEN_CACHE_TTL:
+            return entry['response']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _token_cache_put(key: str, response: Dict):
+    try:
+        entries = orjson.loads(_TOKEN_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        entries = {}
+    if not isinstance(entries, dict):
+        entries = {}
+    entries[key] = {'cached_at': time.time(), 'response': response}
+    try:
+        fd = os.open(_TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as cache_file:
+            os.fchmod(fd, 0o600)
+            cache_file.write(orjson.dumps(entries))
+    except OSError:
+        pass
 
 class UwuzuError(Exception):
     pass
 
 class UwuzuObject:
+    __slots__ = ('_client', '_data', '__weakref__')
+
     def __init__(self, client, data: Dict):
         self._client = client
         self._data = data
-        for key, value in data.items():
-            if not hasattr(self, key):
-                setattr(self, key, value)
+
+    def __getattr__(self, name):
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
     def __repr__(self):
         return f"<{self.__class__.__name__} {self._data}>"
@@ -22,6 +93,8 @@ class UwuzuObject:
         return self._data.get(key, default)
 
 class User(UwuzuObject):
+    __slots__ = ()
+
     @property
     def id(self):
         return self._data.get('userid')
@@ -40,13 +113,21 @@ class User(UwuzuObject):
         return self._client.get_user(self.id)
 
 class Post(UwuzuObject):
+    __slots__ = ('_author',)
+
+    def __init__(self, client, data: Dict):
+        super().__init__(client, data)
+        self._author = None
+
     @property
     def id(self):
         return self._data.get('uniqid')
 
     @property
     def author(self):
-        return User(self._client, self._data.get('account', {}))
+        if self._author is None:
+            self._author = User(self._client, self._data.get('account', {}))
+        return self._author
 
     @property
     def text_content(self):
@@ -71,57 +152,97 @@ class Post(UwuzuObject):
         return self._client.get_replies(self.id, limit=limit)
 
 class Notification(UwuzuObject):
+    __slots__ = ('_from_user',)
+
+    def __init__(self, client, data: Dict):
+        super().__init__(client, data)
+        self._from_user = None
+
     @property
     def from_user(self):
-        return User(self._client, self._data.get('from', {}))
+        if self._from_user is None:
+            self._from_user = User(self._client, self._data.get('from', {}))
+        return self._from_user
 
 class Uwuzu:
     def __init__(self, domain: str, token: str):
         self.base_url = f"https://{domain}/api"
         self.token = token
         self.session = requests.Session()
+        adapter = _build_adapter()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'Content-Type': 'application/json',
-            'User-Agent': 'UwuzuPythonClient/Complete'
+            'User-Agent': 'UwuzuPythonClient/Complete',
+            'Accept-Encoding': _ACCEPT_ENCODING
         })
+        self._image_cache = functools.lru_cache(maxsize=32)(
+            lambda path, mtime_ns, size: self._encode_image(path)
+        )
+        self._urls = {}
 
     @staticmethod
-    def get_access_token(domain: str, session_id: str) -> Dict:
+    def get_access_token(domain: str, session_id: str, use_cache: bool = True) -> Dict:
+        cache_key = hashlib.sha256((domain + session_id).encode()).hexdigest()
+        if use_cache:
+            cached = _token_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         url = f"https://{domain}/api/token/get"
         try:
-            response = requests.post(url, json={"session": session_id})
+            response = _bootstrap_session.post(url, data=orjson.dumps({"session": session_id}), headers={'Content-Type': 'application/json'})
             response.raise_for_status()
-            return response.json()
+            result = orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             raise UwuzuError(f"Failed to get token: {e}")
+        except orjson.JSONDecodeError:
+            raise UwuzuError(f"Failed to decode JSON response from {url}")
+
+        if use_cache:
+            _token_cache_put(cache_key, result)
+        return result
 
     def _encode_image(self, file_path: str) -> str:
+        encoded = bytearray()
         with open(file_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+            while chunk := image_file.read(3 * 65536):
+                encoded += binascii.b2a_base64(chunk, newline=False)
+        return encoded.decode('ascii')
+
+    def _encode_image_cached(self, file_path: str) -> str:
+        stat = os.stat(file_path)
+        return self._image_cache(file_path, stat.st_mtime_ns, stat.st_size)
 
     def _request(self, endpoint: str, method: str = "POST", params: Optional[Dict] = None, data: Optional[Dict] = None) -> Union[Dict, List, Any]:
-        url = f"{self.base_url}{endpoint}"
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self.base_url + endpoint
         try:
             if method == "GET":
-                if params is None: params = {}
-                params['token'] = self.token
+                params = {**params, 'token': self.token} if params else {'token': self.token}
                 response = self.session.get(url, params=params)
             else:
-                if data is None: data = {}
-                data['token'] = self.token
-                response = self.session.post(url, json=data)
+                payload = {**data, 'token': self.token} if data else {'token': self.token}
+                response = self.session.post(url, data=orjson.dumps(payload))
 
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise UwuzuError(f"API Request failed: {e}")
-        except json.JSONDecodeError:
-            raise UwuzuError(f"Failed to decode JSON response from {url}")
+            if response.status_code >= 400:
+                raise UwuzuError(f"HTTP {response.status_code} at {endpoint}: {response.text[:200]}")
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise UwuzuError(f"API call {endpoint} failed: {e}") from e
 
     def _wrap_list(self, data: List, cls) -> List:
-        if not isinstance(data, list): return []
+        if type(data) is not list: return []
         return [cls(self, item) for item in data]
 
+    def _list_request(self, endpoint: str, limit: int = None, page: int = None, **extra) -> List[Post]:
+        params = extra
+        if limit: params['limit'] = limit
+        if page: params['page'] = page
+        return self._wrap_list(self._request(endpoint, method="GET", params=params), Post)
+
     def get_server_info(self) -> Dict:
         return self._request("/serverinfo-api", method="GET")
 
@@ -134,12 +255,8 @@ class Uwuzu:
         if limit: params['limit'] = limit
         if page: params['page'] = page
         data = self._request("/me/notification/", method="GET", params=params)
-        
-        notif_list = []
-        if isinstance(data, dict):
-            for k, v in data.items():
-                if k.isdigit() and isinstance(v, dict):
-                    notif_list.append(v)
+
+        notif_list = [v for k, v in data.items() if k[:1].isdigit()] if isinstance(data, dict) else []
         return self._wrap_list(notif_list, Notification)
 
     def read_notifications(self) -> Dict:
@@ -149,14 +266,18 @@ class Uwuzu:
         payload = {}
         if username: payload['username'] = username
         if profile: payload['profile'] = profile
-        if icon_path: payload['icon'] = self._encode_image(icon_path)
-        if header_path: payload['header'] = self._encode_image(header_path)
+        if icon_path: payload['icon'] = self._encode_image_cached(icon_path)
+        if header_path: payload['header'] = self._encode_image_cached(header_path)
         return self._request("/me/settings/", method="POST", data=payload)
 
     def get_user(self, userid: str) -> User:
         data = self._request("/users/", method="GET", params={"userid": userid})
         return User(self, data)
 
+    def get_users_bulk(self, userids: List[str], max_workers: int = 8) -> List[User]:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_user, userids))
+
     def follow(self, userid: str) -> Dict:
         return self._request("/users/follow", method="POST", data={"userid": userid})
 
@@ -164,10 +285,7 @@ class Uwuzu:
         return self._request("/users/unfollow", method="POST", data={"userid": userid})
 
     def get_timeline(self, limit: int = 25, page: int = None) -> List[Post]:
-        params = {'limit': limit}
-        if page: params['page'] = page
-        data = self._request("/ueuse/", method="GET", params=params)
-        return self._wrap_list(data, Post)
+        return self._list_request("/ueuse/", limit=limit, page=page)
 
     def get_post(self, uniqid: str) -> Post:
         data = self._request("/ueuse/get", method="GET", params={"uniqid": uniqid})
@@ -176,45 +294,25 @@ class Uwuzu:
         return None
 
     def get_replies(self, uniqid: str, limit: int = None, page: int = None) -> List[Post]:
-        params = {'uniqid': uniqid}
-        if limit: params['limit'] = limit
-        if page: params['page'] = page
-        data = self._request("/ueuse/replies", method="GET", params=params)
-        return self._wrap_list(data, Post)
-
-    def get_mentions(self, limit: int = None, page: int = None) -> List[Post]:
-        params = {}
-        if limit: params['limit'] = limit
-        if page: params['page'] = page
-        data = self._request("/ueuse/mentions", method="GET", params=params)
-        return self._wrap_list(data, Post)
+        return self._list_request("/ueuse/replies", limit=limit, page=page, uniqid=uniqid)
 
     def search(self, keyword: str, limit: int = None, page: int = None) -> List[Post]:
-        params = {'keyword': keyword}
-        if limit: params['limit'] = limit
-        if page: params['page'] = page
-        data = self._request("/ueuse/search", method="GET", params=params)
-        return self._wrap_list(data, Post)
+        return self._list_request("/ueuse/search", limit=limit, page=page, keyword=keyword)
 
     def create_post(self, text: str, replyid: str = None, reuseid: str = None, nsfw: bool = False, image_paths: List[str] = None) -> Dict:
         payload = {"text": text, "nsfw": nsfw}
         if replyid: payload["replyid"] = replyid
         if reuseid: payload["reuseid"] = reuseid
         if image_paths:
-            for i, path in enumerate(image_paths[:4]):
-                payload[f"image{i+1}"] = self._encode_image(path)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                encoded = list(executor.map(self._encode_image_cached, image_paths[:4]))
+            for i, image in enumerate(encoded):
+                payload[f"image{i+1}"] = image
         return self._request("/ueuse/create", method="POST", data=payload)
 
     def delete_post(self, uniqid: str) -> Dict:
         return self._request("/ueuse/delete", method="POST", data={"uniqid": uniqid})
     
-    def get_bookmarks(self, limit: int = None, page: int = None) -> List[Post]:
-        params = {}
-        if limit: params['limit'] = limit
-        if page: params['page'] = page
-        data = self._request("/ueuse/bookmark/", method="GET", params=params)
-        return self._wrap_list(data, Post)
-
     def favorite_change(self, uniqid: str) -> Dict:
         return self._request("/farovite/change", method="POST", data={"uniqid": uniqid})
 
@@ -225,6 +323,10 @@ class Uwuzu:
         data = self._request("/admin/users/", method="POST", data={"userid": userid})
         return User(self, data)
 
+    def admin_get_users_bulk(self, userids: List[str], max_workers: int = 8) -> List[User]:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.admin_get_user, userids))
+
     def admin_sanction(self, userid: str, type: str, title: str = None, message: str = None, really: str = None) -> Dict:
         payload = {"userid": userid, "type": type}
         if title: payload["notification_title"] = title
@@ -245,31 +347,304 @@ class Uwuzu:
         return self._request("/admin/reports/resolve", method="POST", data=data)
 
     def iter_timeline(self, limit_per_request: int = 25, max_pages: int = 10) -> Generator[Post, None, None]:
-        for page in range(1, max_pages + 1):
-            posts = self.get_timeline(limit=limit_per_request, page=page)
-            if not posts:
-                break
-            for post in posts:
-                yield post
-            time.sleep(0.5)
+        executor = ThreadPoolExecutor(max_workers=4)
+        try:
+            futures = [executor.submit(self.get_timeline, limit=limit_per_request, page=page)
+                       for page in range(1, max_pages + 1)]
+            for future in futures:
+                posts = future.result()
+                if not posts:
+                    break
+                for post in posts:
+                    yield post
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def watch_timeline(self, interval: int = 60, callback: Callable[[Post], None] = None):
         seen_ids = set()
+        seen_order = deque(maxlen=1024)
         first_run = True
-        
+
+        def remember(post_id):
+            if len(seen_order) == seen_order.maxlen:
+                seen_ids.discard(seen_order[0])
+            seen_order.append(post_id)
+            seen_ids.add(post_id)
+
         while True:
             try:
                 posts = self.get_timeline(limit=10)
                 if first_run:
-                    seen_ids = {p.id for p in posts}
+                    for post in reversed(posts):
+                        remember(post.id)
                     first_run = False
                 else:
                     new_posts = [p for p in posts if p.id not in seen_ids]
                     for post in reversed(new_posts):
-                        seen_ids.add(post.id)
+                        remember(post.id)
                         if callback:
                             callback(post)
             except Exception as e:
                 print(f"Watch Error: {e}")
             
             time.sleep(interval)
+
+_LIST_ENDPOINTS = {
+    'get_mentions': '/ueuse/mentions',
+    'get_bookmarks': '/ueuse/bookmark/',
+}
+
+def _make_list_method(name, endpoint):
+    def method(self, limit: int = None, page: int = None) -> List[Post]:
+        return self._list_request(endpoint, limit=limit, page=page)
+    method.__name__ = name
+    method.__qualname__ = f"Uwuzu.{name}"
+    return method
+
+for _name, _endpoint in _LIST_ENDPOINTS.items():
+    setattr(Uwuzu, _name, _make_list_method(_name, _endpoint))
+del _name, _endpoint
+
+class AsyncUwuzu:
+    def __init__(self, domain: str, token: str):
+        if httpx is None:
+            raise UwuzuError("AsyncUwuzu requires httpx; install with 'pip install uwuzu.py[async]'")
+        self.token = token
+        self.client = httpx.AsyncClient(
+            http2=True,
+            base_url=f"https://{domain}/api",
+            headers={
+                'Content-Type': 'application/json',
+                'User-Agent': 'UwuzuPythonClient/Complete'
+            },
+            limits=httpx.Limits(max_connections=32)
+        )
+
+    _encode_image = Uwuzu._encode_image
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        await self.client.aclose()
+
+    @staticmethod
+    async def get_access_token(domain: str, session_id: str, use_cache: bool = True) -> Dict:
+        if httpx is None:
+            raise UwuzuError("AsyncUwuzu requires httpx; install with 'pip install uwuzu.py[async]'")
+        cache_key = hashlib.sha256((domain + session_id).encode()).hexdigest()
+        if use_cache:
+            cached = _token_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        url = f"https://{domain}/api/token/get"
+        try:
+            async with httpx.AsyncClient(http2=True) as client:
+                response = await client.post(url, content=orjson.dumps({"session": session_id}), headers={'Content-Type': 'application/json'})
+            if response.status_code >= 400:
+                raise UwuzuError(f"HTTP {response.status_code} at {url}: {response.text[:200]}")
+            result = orjson.loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:
+            raise UwuzuError(f"Failed to get token: {e}") from e
+
+        if use_cache:
+            _token_cache_put(cache_key, result)
+        return result
+
+    async def _request(self, endpoint: str, method: str = "POST", params: Optional[Dict] = None, data: Optional[Dict] = None) -> Union[Dict, List, Any]:
+        try:
+            if method == "GET":
+                params = {**params, 'token': self.token} if params else {'token': self.token}
+                response = await self.client.get(endpoint, params=params)
+            else:
+                payload = {**data, 'token': self.token} if data else {'token': self.token}
+                response = await self.client.post(endpoint, content=orjson.dumps(payload))
+
+            if response.status_code >= 400:
+                raise UwuzuError(f"HTTP {response.status_code} at {endpoint}: {response.text[:200]}")
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:
+            raise UwuzuError(f"API call {endpoint} failed: {e}") from e
+
+    def _wrap_list(self, data: List, cls) -> List:
+        if type(data) is not list: return []
+        return [cls(self, item) for item in data]
+
+    async def get_server_info(self) -> Dict:
+        return await self._request("/serverinfo-api", method="GET")
+
+    async def get_me(self) -> User:
+        data = await self._request("/me/", method="GET")
+        return User(self, data)
+
+    async def get_notifications(self, limit: int = None, page: int = None) -> List[Notification]:
+        params = {}
+        if limit: params['limit'] = limit
+        if page: params['page'] = page
+        data = await self._request("/me/notification/", method="GET", params=params)
+
+        notif_list = [v for k, v in data.items() if k[:1].isdigit()] if isinstance(data, dict) else []
+        return self._wrap_list(notif_list, Notification)
+
+    async def read_notifications(self) -> Dict:
+        return await self._request("/me/notification/read", method="POST")
+
+    async def update_profile(self, username: str = None, profile: str = None, icon_path: str = None, header_path: str = None) -> Dict:
+        payload = {}
+        if username: payload['username'] = username
+        if profile: payload['profile'] = profile
+        if icon_path: payload['icon'] = await asyncio.to_thread(self._encode_image, icon_path)
+        if header_path: payload['header'] = await asyncio.to_thread(self._encode_image, header_path)
+        return await self._request("/me/settings/", method="POST", data=payload)
+
+    async def get_user(self, userid: str) -> User:
+        data = await self._request("/users/", method="GET", params={"userid": userid})
+        return User(self, data)
+
+    async def gather_users(self, userids: List[str]) -> List[User]:
+        return list(await asyncio.gather(*(self.get_user(userid) for userid in userids)))
+
+    async def follow(self, userid: str) -> Dict:
+        return await self._request("/users/follow", method="POST", data={"userid": userid})
+
+    async def unfollow(self, userid: str) -> Dict:
+        return await self._request("/users/unfollow", method="POST", data={"userid": userid})
+
+    async def get_timeline(self, limit: int = 25, page: int = None) -> List[Post]:
+        params = {'limit': limit}
+        if page: params['page'] = page
+        data = await self._request("/ueuse/", method="GET", params=params)
+        return self._wrap_list(data, Post)
+
+    async def get_post(self, uniqid: str) -> Post:
+        data = await self._request("/ueuse/get", method="GET", params={"uniqid": uniqid})
+        if isinstance(data, list) and data:
+            return Post(self, data[0])
+        return None
+
+    async def get_replies(self, uniqid: str, limit: int = None, page: int = None) -> List[Post]:
+        params = {'uniqid': uniqid}
+        if limit: params['limit'] = limit
+        if page: params['page'] = page
+        data = await self._request("/ueuse/replies", method="GET", params=params)
+        return self._wrap_list(data, Post)
+
+    async def get_mentions(self, limit: int = None, page: int = None) -> List[Post]:
+        params = {}
+        if limit: params['limit'] = limit
+        if page: params['page'] = page
+        data = await self._request("/ueuse/mentions", method="GET", params=params)
+        return self._wrap_list(data, Post)
+
+    async def search(self, keyword: str, limit: int = None, page: int = None) -> List[Post]:
+        params = {'keyword': keyword}
+        if limit: params['limit'] = limit
+        if page: params['page'] = page
+        data = await self._request("/ueuse/search", method="GET", params=params)
+        return self._wrap_list(data, Post)
+
+    async def create_post(self, text: str, replyid: str = None, reuseid: str = None, nsfw: bool = False, image_paths: List[str] = None) -> Dict:
+        payload = {"text": text, "nsfw": nsfw}
+        if replyid: payload["replyid"] = replyid
+        if reuseid: payload["reuseid"] = reuseid
+        if image_paths:
+            encoded = await asyncio.gather(*(asyncio.to_thread(self._encode_image, path) for path in image_paths[:4]))
+            for i, image in enumerate(encoded):
+                payload[f"image{i+1}"] = image
+        return await self._request("/ueuse/create", method="POST", data=payload)
+
+    async def delete_post(self, uniqid: str) -> Dict:
+        return await self._request("/ueuse/delete", method="POST", data={"uniqid": uniqid})
+
+    async def get_bookmarks(self, limit: int = None, page: int = None) -> List[Post]:
+        params = {}
+        if limit: params['limit'] = limit
+        if page: params['page'] = page
+        data = await self._request("/ueuse/bookmark/", method="GET", params=params)
+        return self._wrap_list(data, Post)
+
+    async def favorite_change(self, uniqid: str) -> Dict:
+        return await self._request("/farovite/change", method="POST", data={"uniqid": uniqid})
+
+    async def favorite_get(self, uniqid: str) -> Dict:
+        return await self._request("/farovite/get", method="GET", params={"uniqid": uniqid})
+
+    async def admin_get_user(self, userid: str) -> User:
+        data = await self._request("/admin/users/", method="POST", data={"userid": userid})
+        return User(self, data)
+
+    async def admin_get_users_bulk(self, userids: List[str]) -> List[User]:
+        return list(await asyncio.gather(*(self.admin_get_user(userid) for userid in userids)))
+
+    async def admin_sanction(self, userid: str, type: str, title: str = None, message: str = None, really: str = None) -> Dict:
+        payload = {"userid": userid, "type": type}
+        if title: payload["notification_title"] = title
+        if message: payload["notification_message"] = message
+        if really: payload["really"] = really
+        return await self._request("/admin/users/sanction", method="POST", data=payload)
+
+    async def admin_get_reports(self, limit: int = None, page: int = None) -> Dict:
+        data = {}
+        if limit: data["limit"] = limit
+        if page: data["page"] = page
+        return await self._request("/admin/reports/", method="POST", data=data)
+
+    async def admin_resolve_report(self, reported_userid: str = None, uniqid: str = None) -> Dict:
+        data = {}
+        if reported_userid: data["reported_userid"] = reported_userid
+        if uniqid: data["uniqid"] = uniqid
+        return await self._request("/admin/reports/resolve", method="POST", data=data)
+
+    async def iter_timeline(self, limit_per_request: int = 25, max_pages: int = 10) -> AsyncGenerator[Post, None]:
+        semaphore = asyncio.Semaphore(4)
+
+        async def fetch(page):
+            async with semaphore:
+                return await self.get_timeline(limit=limit_per_request, page=page)
+
+        tasks = [asyncio.create_task(fetch(page)) for page in range(1, max_pages + 1)]
+        try:
+            for task in tasks:
+                posts = await task
+                if not posts:
+                    break
+                for post in posts:
+                    yield post
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def watch_timeline(self, interval: int = 60, callback: Callable[[Post], None] = None):
+        seen_ids = set()
+        seen_order = deque(maxlen=1024)
+        first_run = True
+
+        def remember(post_id):
+            if len(seen_order) == seen_order.maxlen:
+                seen_ids.discard(seen_order[0])
+            seen_order.append(post_id)
+            seen_ids.add(post_id)
+
+        while True:
+            try:
+                posts = await self.get_timeline(limit=10)
+                if first_run:
+                    for post in reversed(posts):
+                        remember(post.id)
+                    first_run = False
+                else:
+                    new_posts = [p for p in posts if p.id not in seen_ids]
+                    for post in reversed(new_posts):
+                        remember(post.id)
+                        if callback:
+                            result = callback(post)
+                            if asyncio.iscoroutine(result):
+                                await result
+            except Exception as e:
+                print(f"Watch Error: {e}")
+
+            await asyncio.sleep(interval)